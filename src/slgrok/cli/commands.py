@@ -1,9 +1,9 @@
 """CLI command definitions."""
 
-from typing import Annotated
+import functools
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
 
 from slgrok.cli.help import get_help
 from slgrok.cli.options import (
@@ -19,23 +19,93 @@ from slgrok.cli.options import (
     TruncateOption,
     TunnelOption,
 )
-from slgrok.models.filters import RequestFilters, StatusCodeFilter, TimeWindow
-from slgrok.models.output import FormatOptions
-from slgrok.models.requests import CapturedRequest
-from slgrok.repositories.ngrok import NgrokConnectionError, NgrokRepository
-from slgrok.services.formatter import FormatterService
-from slgrok.services.inspector import InspectorService
-from slgrok.settings import settings
 
-console = Console()
-err_console = Console(stderr=True)
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rich.console import Console
+
+    from slgrok.models.filters import RequestFilters
+    from slgrok.models.output import FormatOptions
+    from slgrok.models.requests import CapturedRequest
+
+# Heavy dependencies (pydantic models, httpx repository, services, settings)
+# are imported inside the functions that need them so importing this module
+# stays cheap for lightweight paths like `slgrok help`.
+
+
+@functools.cache
+def console() -> "Console":
+    """Shared stdout console, constructed on first print."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.cache
+def err_console() -> "Console":
+    """Shared stderr console, constructed on first print."""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
+@functools.cache
+def _default_base_url() -> str:
+    """Default base URL from settings, normalized once per process."""
+    from slgrok.settings import settings
+
+    return str(settings.base_url).rstrip("/")
 
 
 def _get_base_url(base_url: str | None) -> str:
     """Get the base URL, preferring CLI option over settings."""
     if base_url is not None:
         return base_url.rstrip("/")
-    return str(settings.base_url).rstrip("/")
+    return _default_base_url()
+
+
+def _cli_errors[**P](func: "Callable[P, None]") -> "Callable[P, None]":
+    """Report known failures uniformly and exit with status 1.
+
+    NgrokConnectionError is matched via isinstance inside a generic except
+    so the happy path never imports the repository module from here.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
+        try:
+            func(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except ValueError as e:
+            err_console().print(f"Error: {e}")
+            raise typer.Exit(1) from None
+        except Exception as e:
+            from slgrok.repositories.ngrok import NgrokConnectionError
+
+            if not isinstance(e, NgrokConnectionError):
+                raise
+            err_console().print(str(e))
+            raise typer.Exit(1) from None
+
+    return wrapper
+
+
+@functools.cache
+def _default_filters() -> "RequestFilters":
+    """Shared RequestFilters instance for the no-flags case."""
+    from slgrok.models.filters import RequestFilters
+
+    return RequestFilters()
+
+
+@functools.cache
+def _default_format_options() -> "FormatOptions":
+    """Shared FormatOptions instance for the no-flags case."""
+    from slgrok.models.output import FormatOptions
+
+    return FormatOptions()
 
 
 def _build_filters(
@@ -46,8 +116,21 @@ def _build_filters(
     domain: str | None = None,
     tunnel: str | None = None,
     since: str | None = None,
-) -> RequestFilters:
+) -> "RequestFilters":
     """Build RequestFilters from CLI options."""
+    if (
+        limit is None
+        and status is None
+        and not errors
+        and path is None
+        and domain is None
+        and tunnel is None
+        and since is None
+    ):
+        return _default_filters()
+
+    from slgrok.models.filters import RequestFilters, StatusCodeFilter, TimeWindow
+
     status_filter = None
     if status is not None or errors:
         if status is not None:
@@ -73,8 +156,13 @@ def _build_format_options(
     pretty: bool = False,
     truncate: int | None = None,
     debug: bool = False,
-) -> FormatOptions:
+) -> "FormatOptions":
     """Build FormatOptions from CLI options."""
+    if not pretty and truncate is None and not debug:
+        return _default_format_options()
+
+    from slgrok.models.output import FormatOptions
+
     return FormatOptions(
         pretty_print=pretty,
         truncate=truncate,
@@ -82,33 +170,34 @@ def _build_format_options(
     )
 
 
-def _build_filters_summary(filters: RequestFilters) -> str | None:
-    """Build a human-readable summary of applied filters."""
+def _build_filters_parts(filters: "RequestFilters") -> list[str]:
+    """Build the human-readable pieces of the applied-filters summary."""
     parts: list[str] = []
 
     if filters.status is not None:
         if filters.status.errors_only:
             parts.append("errors only")
         if filters.status.exact:
-            parts.append(f"status={','.join(str(c) for c in filters.status.exact)}")
+            parts.append("status=" + ",".join(map(str, filters.status.exact)))
         if filters.status.ranges:
-            parts.append(f"status={','.join(filters.status.ranges)}")
+            parts.append("status=" + ",".join(filters.status.ranges))
 
     if filters.path_pattern is not None:
-        parts.append(f"path={filters.path_pattern}")
+        parts.append("path=" + filters.path_pattern)
 
     if filters.domain is not None:
-        parts.append(f"domain={filters.domain}")
+        parts.append("domain=" + filters.domain)
 
     if filters.tunnel_name is not None:
-        parts.append(f"tunnel={filters.tunnel_name}")
+        parts.append("tunnel=" + filters.tunnel_name)
 
     if filters.time_window is not None:
-        parts.append(f"since={filters.time_window.value}{filters.time_window.unit}")
+        parts.append("since=" + str(filters.time_window))
 
-    return ", ".join(parts) if parts else None
+    return parts
 
 
+@_cli_errors
 def list_requests(
     base_url: BaseUrlOption = None,
     limit: LimitOption = 20,
@@ -123,49 +212,45 @@ def list_requests(
     debug: DebugOption = False,
 ) -> None:
     """List captured requests from ngrok inspector."""
-    try:
-        url = _get_base_url(base_url)
-        filters = _build_filters(limit, status, errors, path, domain, tunnel, since)
-        format_options = _build_format_options(pretty, truncate, debug)
+    from slgrok.repositories.ngrok import NgrokRepository
+    from slgrok.services.formatter import FormatterService
+    from slgrok.services.inspector import InspectorService
 
-        if debug:
-            err_console.print("[dim][DEBUG] Debug mode enabled[/dim]")
-            err_console.print(f"[dim][DEBUG] Fetching from {url}[/dim]")
+    url = _get_base_url(base_url)
+    filters = _build_filters(limit, status, errors, path, domain, tunnel, since)
+    format_options = _build_format_options(pretty, truncate, debug)
 
-        with NgrokRepository(url) as repo:
-            service = InspectorService(repo)
-            requests = service.get_requests(filters)
+    if debug:
+        err_console().print("[dim][DEBUG] Debug mode enabled[/dim]")
+        err_console().print(f"[dim][DEBUG] Fetching from {url}[/dim]")
 
-            if debug:
-                err_console.print(f"[dim][DEBUG] Retrieved {len(requests)} requests[/dim]")
+    with NgrokRepository(url) as repo:
+        service = InspectorService(repo)
+        requests = service.get_requests(filters)
 
-            if not requests:
-                filters_summary = _build_filters_summary(filters)
-                err_console.print("No requests found matching filters:")
-                if filters_summary:
-                    for part in filters_summary.split(", "):
-                        err_console.print(f"  • {part}")
-                err_console.print("\nTry broadening your filters or check ngrok at:")
-                err_console.print(f"{url}/inspect/http")
-                raise typer.Exit(1)
+        if debug:
+            err_console().print(f"[dim][DEBUG] Retrieved {len(requests)} requests[/dim]")
+
+        filters_parts = _build_filters_parts(filters)
+
+        if not requests:
+            err_console().print("No requests found matching filters:")
+            for part in filters_parts:
+                err_console().print(f"  • {part}")
+            err_console().print("\nTry broadening your filters or check ngrok at:")
+            err_console().print(f"{url}/inspect/http")
+            raise typer.Exit(1)
+
+        formatter = FormatterService()
+        output = formatter.format_requests(
+            requests,
+            format_options,
+            ", ".join(filters_parts) if filters_parts else None,
+        )
+        console().print(output)
 
-            formatter = FormatterService()
-            output = formatter.format_requests(
-                requests,
-                format_options,
-                _build_filters_summary(filters),
-            )
-            console.print(output)
-
-    except NgrokConnectionError as e:
-        err_console.print(str(e))
-        raise typer.Exit(1) from None
-    except ValueError as e:
-        err_console.print(f"Error: {e}")
-        raise typer.Exit(1) from None
-
-
-def _log_request_debug(request: CapturedRequest) -> None:
+
+def _log_request_debug(request: "CapturedRequest") -> None:
     """Log debug information about a captured request."""
     req_id = request.id
     method = request.request.method
@@ -173,25 +258,27 @@ def _log_request_debug(request: CapturedRequest) -> None:
 
     # Check response state
     if request.response is None:
-        err_console.print(f"[dim][DEBUG][/dim] {req_id} {method} {uri}: response is None")
+        err_console().print(f"[dim][DEBUG][/dim] {req_id} {method} {uri}: response is None")
         return
 
     # Check response.raw state
     if request.response.raw is None:
-        err_console.print(f"[dim][DEBUG][/dim] {req_id} {method} {uri}: response.raw is None")
+        err_console().print(f"[dim][DEBUG][/dim] {req_id} {method} {uri}: response.raw is None")
     elif len(request.response.raw) == 0:
-        err_console.print(f"[dim][DEBUG][/dim] {req_id} {method} {uri}: response.raw is empty")
+        err_console().print(f"[dim][DEBUG][/dim] {req_id} {method} {uri}: response.raw is empty")
     else:
         # Log raw length and content-length header for comparison
         raw_len = len(request.response.raw)
-        content_length = request.response.headers.root.get("Content-Length", [None])[0]
+        content_length_values = request.response.headers.get("content-length")
+        content_length = content_length_values[0] if content_length_values else None
         status = request.response.status_code
-        err_console.print(
+        err_console().print(
             f"[dim][DEBUG][/dim] {req_id} {method} {uri}: "
             f"status={status}, raw_b64_len={raw_len}, content-length={content_length}"
         )
 
 
+@_cli_errors
 def tail_requests(
     base_url: BaseUrlOption = None,
     status: StatusOption = None,
@@ -204,20 +291,28 @@ def tail_requests(
     debug: DebugOption = False,
 ) -> None:
     """Watch for new requests in real-time."""
-    try:
-        url = _get_base_url(base_url)
-        filters = _build_filters(None, status, errors, path, domain, tunnel, None)
-        format_options = _build_format_options(pretty, truncate, debug)
+    from slgrok.repositories.ngrok import NgrokRepository
+    from slgrok.services.formatter import FormatterService
+    from slgrok.services.inspector import InspectorService
 
-        console.print("Watching for requests... (Ctrl+C to stop)\n")
-        if debug:
-            err_console.print("[dim][DEBUG] Debug mode enabled[/dim]")
-            err_console.print(f"[dim][DEBUG] Connecting to {url}[/dim]")
+    url = _get_base_url(base_url)
+    filters = _build_filters(None, status, errors, path, domain, tunnel, None)
+    format_options = _build_format_options(pretty, truncate, debug)
 
+    console().print("Watching for requests... (Ctrl+C to stop)\n")
+    if debug:
+        err_console().print("[dim][DEBUG] Debug mode enabled[/dim]")
+        err_console().print(f"[dim][DEBUG] Connecting to {url}[/dim]")
+
+    try:
         with NgrokRepository(url) as repo:
             service = InspectorService(repo)
             formatter = FormatterService()
 
+            # When piped (tail | grep ...) skip Rich's per-line width
+            # measuring and wrapping; markup is still stripped on render.
+            soft_wrap = not console().is_terminal
+
             for request in service.tail_requests(filters, debug=debug):
                 if debug:
                     _log_request_debug(request)
@@ -225,20 +320,15 @@ def tail_requests(
                 label = f"{request.request.method} {request.request.uri}"
                 separator = formatter._build_separator(label)
                 output = formatter.format_request(request, format_options)
-                console.print(separator)
-                console.print("")
-                console.print(output)
-
-    except NgrokConnectionError as e:
-        err_console.print(str(e))
-        raise typer.Exit(1) from None
+                # Single render/flush per event; three prints per request is
+                # the dominant cost when tailing a busy tunnel.
+                console().print(f"{separator}\n\n{output}", soft_wrap=soft_wrap)
     except KeyboardInterrupt:
-        console.print("\nStopped watching.")
-    except ValueError as e:
-        err_console.print(f"Error: {e}")
-        raise typer.Exit(1) from None
+        # Tail-specific: Ctrl+C is the normal way to stop watching
+        console().print("\nStopped watching.")
 
 
+@_cli_errors
 def get_request(
     request_id: Annotated[str, typer.Argument(help="The request ID to retrieve")],
     base_url: BaseUrlOption = None,
@@ -247,30 +337,25 @@ def get_request(
     debug: DebugOption = False,
 ) -> None:
     """Get details of a specific request by ID."""
-    try:
-        url = _get_base_url(base_url)
-        format_options = _build_format_options(pretty, truncate, debug)
+    from slgrok.repositories.ngrok import NgrokRepository
+    from slgrok.services.formatter import FormatterService
 
-        if debug:
-            err_console.print("[dim][DEBUG] Debug mode enabled[/dim]")
-            err_console.print(f"[dim][DEBUG] Fetching {request_id} from {url}[/dim]")
+    url = _get_base_url(base_url)
+    format_options = _build_format_options(pretty, truncate, debug)
 
-        with NgrokRepository(url) as repo:
-            request = repo.get_request(request_id)
+    if debug:
+        err_console().print("[dim][DEBUG] Debug mode enabled[/dim]")
+        err_console().print(f"[dim][DEBUG] Fetching {request_id} from {url}[/dim]")
 
-            if debug:
-                _log_request_debug(request)
+    with NgrokRepository(url) as repo:
+        request = repo.get_request(request_id)
 
-            formatter = FormatterService()
-            output = formatter.format_request(request, format_options)
-            console.print(output)
+        if debug:
+            _log_request_debug(request)
 
-    except NgrokConnectionError as e:
-        err_console.print(str(e))
-        raise typer.Exit(1) from None
-    except ValueError as e:
-        err_console.print(f"Error: {e}")
-        raise typer.Exit(1) from None
+        formatter = FormatterService()
+        output = formatter.format_request(request, format_options)
+        console().print(output)
 
 
 def show_help(
@@ -281,4 +366,4 @@ def show_help(
 ) -> None:
     """Show detailed help and examples."""
     help_text = get_help(command)
-    console.print(help_text)
+    console().print(help_text)
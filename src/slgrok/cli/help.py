@@ -1,5 +1,6 @@
 """Help content for slgrok CLI."""
 
+# Help strings are stripped once at import so `get_help` is a pure dict lookup.
 OVERVIEW = """
 slgrok - ngrok Inspector CLI Tool
 
@@ -29,7 +30,7 @@ GLOBAL OPTIONS:
   --base-url    ngrok inspector URL (default: http://127.0.0.1:4040)
 
 For more help on a specific command, use: slgrok help <command>
-"""
+""".strip()
 
 LIST_HELP = """
 LIST COMMAND
@@ -69,7 +70,7 @@ EXAMPLES:
 FILTER COMBINATIONS:
   Multiple filters can be combined (AND logic):
   slgrok list --errors --path "/api/*" --since 10m
-"""
+""".strip()
 
 TAIL_HELP = """
 TAIL COMMAND
@@ -102,7 +103,7 @@ EXAMPLES:
   slgrok tail --status 5xx --pretty
 
 Press Ctrl+C to stop watching.
-"""
+""".strip()
 
 GET_HELP = """
 GET COMMAND
@@ -129,7 +130,7 @@ EXAMPLES:
 FINDING REQUEST IDS:
   Request IDs are shown in the output of 'slgrok list'.
   You can also find them in the ngrok inspector web UI.
-"""
+""".strip()
 
 COMMAND_HELP = {
     "list": LIST_HELP,
@@ -148,10 +149,10 @@ def get_help(command: str | None = None) -> str:
         Help text string
     """
     if command is None:
-        return OVERVIEW.strip()
+        return OVERVIEW
 
     help_text = COMMAND_HELP.get(command.lower())
     if help_text is None:
         return f"Unknown command: {command}\n\nAvailable commands: list, tail, get"
 
-    return help_text.strip()
+    return help_text
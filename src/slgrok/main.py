@@ -1,8 +1,22 @@
 """Main Typer application."""
 
+from typing import Annotated
+
 import typer
 
-from slgrok.cli.commands import get_request, list_requests, show_help, tail_requests
+from slgrok.cli.options import (
+    BaseUrlOption,
+    DebugOption,
+    DomainOption,
+    ErrorsOption,
+    LimitOption,
+    PathOption,
+    PrettyOption,
+    SinceOption,
+    StatusOption,
+    TruncateOption,
+    TunnelOption,
+)
 
 app = typer.Typer(
     name="slgrok",
@@ -10,11 +24,76 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-# Register commands
-app.command("list", help="List captured requests from ngrok inspector")(list_requests)
-app.command("tail", help="Watch for new requests in real-time")(tail_requests)
-app.command("get", help="Get details of a specific request by ID")(get_request)
-app.command("help", help="Show detailed help and examples")(show_help)
+# Commands are registered as thin wrappers that import the real implementation
+# on invocation, so `--help` and error paths never pay for the rich/httpx/
+# pydantic import graph behind slgrok.cli.commands.
+
+
+@app.command("list", help="List captured requests from ngrok inspector")
+def list_requests(
+    base_url: BaseUrlOption = None,
+    limit: LimitOption = 20,
+    status: StatusOption = None,
+    errors: ErrorsOption = False,
+    path: PathOption = None,
+    domain: DomainOption = None,
+    tunnel: TunnelOption = None,
+    since: SinceOption = None,
+    pretty: PrettyOption = False,
+    truncate: TruncateOption = None,
+    debug: DebugOption = False,
+) -> None:
+    """List captured requests from ngrok inspector."""
+    from slgrok.cli import commands
+
+    commands.list_requests(
+        base_url, limit, status, errors, path, domain, tunnel, since, pretty, truncate, debug
+    )
+
+
+@app.command("tail", help="Watch for new requests in real-time")
+def tail_requests(
+    base_url: BaseUrlOption = None,
+    status: StatusOption = None,
+    errors: ErrorsOption = False,
+    path: PathOption = None,
+    domain: DomainOption = None,
+    tunnel: TunnelOption = None,
+    pretty: PrettyOption = False,
+    truncate: TruncateOption = None,
+    debug: DebugOption = False,
+) -> None:
+    """Watch for new requests in real-time."""
+    from slgrok.cli import commands
+
+    commands.tail_requests(base_url, status, errors, path, domain, tunnel, pretty, truncate, debug)
+
+
+@app.command("get", help="Get details of a specific request by ID")
+def get_request(
+    request_id: Annotated[str, typer.Argument(help="The request ID to retrieve")],
+    base_url: BaseUrlOption = None,
+    pretty: PrettyOption = False,
+    truncate: TruncateOption = None,
+    debug: DebugOption = False,
+) -> None:
+    """Get details of a specific request by ID."""
+    from slgrok.cli import commands
+
+    commands.get_request(request_id, base_url, pretty, truncate, debug)
+
+
+@app.command("help", help="Show detailed help and examples")
+def show_help(
+    command: Annotated[
+        str | None,
+        typer.Argument(help="Command to get help for"),
+    ] = None,
+) -> None:
+    """Show detailed help and examples."""
+    from slgrok.cli import commands
+
+    commands.show_help(command)
 
 
 @app.callback(invoke_without_command=True)
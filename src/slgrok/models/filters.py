@@ -1,22 +1,54 @@
 """Filter models for request queries."""
 
+import fnmatch
 import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import Literal
 
-from pydantic import BaseModel, field_validator
+# Compiled once at import; these run on every CLI invocation that parses filters.
+_TIME_WINDOW_RE = re.compile(r"^(\d+)([smh])$")
+_STATUS_RANGE_RE = re.compile(r"^[1-5]xx$")
 
+_VALID_RANGES = frozenset({"1xx", "2xx", "3xx", "4xx", "5xx"})
 
-class TimeWindow(BaseModel):
+# Bound on memoized path-match results per filter set
+_MATCH_CACHE_MAX = 4096
+
+# Characters that make a path pattern a regex rather than a literal
+_RE_METACHARS = frozenset(".^$*+?{}[]|()\\")
+
+
+@dataclass(slots=True, frozen=True)
+class TimeWindow:
     """Time window for filtering requests."""
 
     value: int
     unit: Literal["s", "m", "h"]
+    # Precomputed so repeated filter passes (tail polls) reuse it
+    _delta: timedelta = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the timedelta for the window."""
+        match self.unit:
+            case "s":
+                delta = timedelta(seconds=self.value)
+            case "m":
+                delta = timedelta(minutes=self.value)
+            case "h":
+                delta = timedelta(hours=self.value)
+            case _:
+                raise ValueError(f"Unknown unit: {self.unit}")
+        object.__setattr__(self, "_delta", delta)
+
+    def __str__(self) -> str:
+        return f"{self.value}{self.unit}"
 
     @classmethod
     def parse(cls, value: str) -> "TimeWindow":
         """Parse shorthand like '5s', '2m', '1h'."""
-        match = re.match(r"^(\d+)([smh])$", value.strip().lower())
+        match = _TIME_WINDOW_RE.match(value.strip().lower())
         if not match:
             raise ValueError(
                 f"Invalid time window format: {value}. Use format like '5s', '2m', '1h'"
@@ -25,51 +57,44 @@ class TimeWindow(BaseModel):
 
     def to_timedelta(self) -> timedelta:
         """Convert to timedelta."""
-        match self.unit:
-            case "s":
-                return timedelta(seconds=self.value)
-            case "m":
-                return timedelta(minutes=self.value)
-            case "h":
-                return timedelta(hours=self.value)
-            case _:
-                raise ValueError(f"Unknown unit: {self.unit}")
+        return self._delta
 
 
-class StatusCodeFilter(BaseModel):
+@dataclass(slots=True, frozen=True)
+class StatusCodeFilter:
     """Filter for HTTP status codes."""
 
-    exact: list[int] = []
-    ranges: list[str] = []  # e.g., "4xx", "5xx"
+    exact: list[int] = field(default_factory=list)
+    ranges: list[str] = field(default_factory=list)  # e.g., "4xx", "5xx"
     errors_only: bool = False
+    # Bitmask over status codes; bit N set means code N matches
+    _mask: int = field(init=False, repr=False, compare=False)
 
-    @field_validator("ranges")
-    @classmethod
-    def validate_ranges(cls, v: list[str]) -> list[str]:
-        """Validate status code ranges."""
-        valid_ranges = {"1xx", "2xx", "3xx", "4xx", "5xx"}
-        for r in v:
-            if r.lower() not in valid_ranges:
+    def __post_init__(self) -> None:
+        """Validate and normalize status code ranges, precompute the match mask."""
+        for r in self.ranges:
+            if r.lower() not in _VALID_RANGES:
                 raise ValueError(f"Invalid status range: {r}. Use 1xx, 2xx, 3xx, 4xx, or 5xx")
-        return [r.lower() for r in v]
+        object.__setattr__(self, "ranges", [r.lower() for r in self.ranges])
+
+        mask = 0
+        for code in self.exact:
+            mask |= 1 << code
+        for r in self.ranges:
+            # e.g. "4xx" sets bits 400-499
+            mask |= ((1 << 100) - 1) << (int(r[0]) * 100)
+        if mask == 0:
+            # No specific filters: match everything (generous upper bound
+            # so nonstandard codes still pass)
+            mask = (1 << 1000) - 1
+        if self.errors_only:
+            # Restrict to >= 400
+            mask &= ~((1 << 400) - 1)
+        object.__setattr__(self, "_mask", mask)
 
     def matches(self, status_code: int) -> bool:
         """Check if a status code matches the filter."""
-        # If errors_only is set, status must be >= 400
-        if self.errors_only and status_code < 400:
-            return False
-
-        # If no specific filters, match all (or just errors if errors_only)
-        if not self.exact and not self.ranges:
-            return True
-
-        # Check exact matches
-        if status_code in self.exact:
-            return True
-
-        # Check range matches
-        range_prefix = f"{status_code // 100}xx"
-        return range_prefix in self.ranges
+        return self._mask >> status_code & 1 == 1
 
     @classmethod
     def from_string(cls, value: str, errors_only: bool = False) -> "StatusCodeFilter":
@@ -77,7 +102,7 @@ class StatusCodeFilter(BaseModel):
         value = value.strip().lower()
 
         # Check if it's a range (e.g., "4xx")
-        if re.match(r"^[1-5]xx$", value):
+        if _STATUS_RANGE_RE.match(value):
             return cls(ranges=[value], errors_only=errors_only)
 
         # Try to parse as exact status code
@@ -92,7 +117,8 @@ class StatusCodeFilter(BaseModel):
             ) from None
 
 
-class RequestFilters(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RequestFilters:
     """Combined filters for request queries."""
 
     limit: int | None = None
@@ -101,3 +127,61 @@ class RequestFilters(BaseModel):
     domain: str | None = None
     tunnel_name: str | None = None
     time_window: TimeWindow | None = None
+    # Compiled once here instead of per request in the filter loop
+    _path_match: Callable[[str], object] | None = field(init=False, repr=False, compare=False)
+    # Anchored host pattern compiled once per filter set
+    _domain_re: "re.Pattern[str] | None" = field(init=False, repr=False, compare=False)
+    # Memoized results per distinct path; busy tunnels hit the same few
+    # endpoints over and over
+    _match_cache: dict[str, bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompile the path pattern (glob or regex) for matching."""
+        matcher: Callable[[str], object] | None = None
+        if self.path_pattern is not None:
+            if "*" in self.path_pattern or "?" in self.path_pattern:
+                matcher = re.compile(fnmatch.translate(self.path_pattern)).match
+            elif not _RE_METACHARS.isdisjoint(self.path_pattern):
+                try:
+                    matcher = re.compile(self.path_pattern).search
+                except re.error:
+                    matcher = None  # Invalid regex: fall back to literal containment
+            # else: plain literal; matches_path's containment branch covers it
+            # without entering the regex engine
+        object.__setattr__(self, "_path_match", matcher)
+        # Anchored so "example.com" matches that host and its subdomains
+        # but not "evil-example.com"; an optional port is tolerated.
+        domain_re = (
+            re.compile(rf"(?:^|\.){re.escape(self.domain.lower())}(?::\d+)?\Z")
+            if self.domain is not None
+            else None
+        )
+        object.__setattr__(self, "_domain_re", domain_re)
+        object.__setattr__(self, "_match_cache", {})
+
+    def matches_path(self, path: str) -> bool:
+        """Check if a URL path matches the configured path pattern.
+
+        Supports glob patterns (with * or ?), regex, and literal substring
+        matching for invalid regex. Results are memoized per path.
+        """
+        cache = self._match_cache
+        result = cache.get(path)
+        if result is None:
+            if self._path_match is not None:
+                result = self._path_match(path) is not None
+            else:
+                result = self.path_pattern is not None and self.path_pattern in path
+            if len(cache) < _MATCH_CACHE_MAX:
+                cache[path] = result
+        return result
+
+    def matches_host(self, host: str) -> bool:
+        """Check if a lowercased host matches the configured domain.
+
+        The domain matches the host itself or any of its subdomains,
+        optionally followed by a port.
+        """
+        if not host or self._domain_re is None:
+            return False
+        return self._domain_re.search(host) is not None
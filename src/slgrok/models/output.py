@@ -1,11 +1,11 @@
 """Output formatting models."""
 
 import sys
+from dataclasses import dataclass
 
-from pydantic import BaseModel
 
-
-class FormatOptions(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FormatOptions:
     """Options controlling output formatting."""
 
     pretty_print: bool = False
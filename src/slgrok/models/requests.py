@@ -1,14 +1,37 @@
 """Pydantic models for ngrok request data."""
 
+import functools
 from datetime import datetime
+from urllib.parse import urlparse
 
-from pydantic import BaseModel, RootModel
+from pydantic import BaseModel, PrivateAttr, RootModel, model_validator
 
 
 class HttpHeaders(RootModel[dict[str, list[str]]]):
-    """HTTP headers as returned by ngrok API."""
+    """HTTP headers as returned by ngrok API.
 
-    pass
+    Header names are case-insensitive; `root` keeps the wire casing for
+    display while lookups go through a lowercased index built once at
+    validation.
+    """
+
+    _by_lower_name: dict[str, list[str]] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _build_lookup_index(self) -> "HttpHeaders":
+        self._by_lower_name = {name.lower(): values for name, values in self.root.items()}
+        return self
+
+    def get(self, name: str) -> list[str]:
+        """Look up a header's values by case-insensitive name.
+
+        Args:
+            name: Header name in any casing
+
+        Returns:
+            List of values, or an empty list if the header is absent
+        """
+        return self._by_lower_name.get(name.lower(), [])
 
 
 class RequestData(BaseModel):
@@ -38,11 +61,52 @@ class CapturedRequest(BaseModel):
     id: str
     tunnel_name: str
     remote_addr: str
-    start: datetime
+    start: str  # ISO8601 as emitted by ngrok; parse lazily via start_dt
     duration: int  # nanoseconds
     request: RequestData
     response: ResponseData | None = None
 
+    @functools.cached_property
+    def start_dt(self) -> datetime:
+        """Parse the start timestamp on first use.
+
+        Only the time-window filter needs a datetime; keeping `start` as
+        the raw string avoids N parses on every list call.
+        """
+        return datetime.fromisoformat(self.start)
+
+    @functools.cached_property
+    def path(self) -> str:
+        """URL path of the request URI, parsed once on first use.
+
+        The path filter may evaluate the same request repeatedly (e.g.
+        across tail polls); caching keeps the parse to one call each.
+        """
+        uri = self.request.uri
+        if not uri.startswith("/"):
+            # Absolute-form URI; leave scheme/netloc handling to urlparse
+            return urlparse(uri).path
+        # Origin-form ("/path?query#fragment") - the common ngrok case;
+        # cutting at the first ? or # avoids the full RFC 3986 parse
+        cut = len(uri)
+        query = uri.find("?")
+        if query != -1:
+            cut = query
+        fragment = uri.find("#", 0, cut)
+        if fragment != -1:
+            cut = fragment
+        return uri[:cut]
+
+    @functools.cached_property
+    def host(self) -> str:
+        """Lowercased Host header value, resolved once on first use.
+
+        Empty string when the request carried no Host header; the domain
+        filter reads this instead of chasing the header chain per check.
+        """
+        values = self.request.headers.get("host")
+        return values[0].lower() if values else ""
+
 
 class CapturedRequestList(BaseModel):
     """Response from GET /api/requests/http."""
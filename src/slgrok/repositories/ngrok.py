@@ -1,5 +1,7 @@
 """ngrok API repository."""
 
+import hashlib
+
 import httpx
 
 from slgrok.models.requests import CapturedRequest, CapturedRequestList
@@ -27,7 +29,24 @@ class NgrokRepository:
 
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.Client(timeout=10.0)
+        # Endpoint URLs are fixed for the repository's lifetime; build
+        # them once instead of per call in the polling loop.
+        self._status_url = f"{self.base_url}/api/status"
+        self._requests_url = f"{self.base_url}/api/requests/http"
+        # Keep-alive connections are reused across the repeated polls that
+        # tail issues, so only the first request pays connection setup.
+        self._client = httpx.Client(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=16,
+                max_connections=32,
+                keepalive_expiry=30.0,
+            ),
+        )
+        # Digest of the last request-list payload; polls that return an
+        # unchanged body skip validation and reuse the parsed models.
+        self._last_list_key: tuple[int | None, str | None, bytes] | None = None
+        self._last_list: list[CapturedRequest] = []
 
     def close(self) -> None:
         """Close the HTTP client."""
@@ -42,7 +61,7 @@ class NgrokRepository:
     def health_check(self) -> bool:
         """Check if ngrok inspector is reachable."""
         try:
-            response = self._client.get(f"{self.base_url}/api/status")
+            response = self._client.get(self._status_url)
             return response.status_code == 200
         except httpx.ConnectError:
             return False
@@ -69,11 +88,23 @@ class NgrokRepository:
 
         try:
             response = self._client.get(
-                f"{self.base_url}/api/requests/http",
+                self._requests_url,
                 params=params if params else None,
             )
             response.raise_for_status()
-            data = CapturedRequestList.model_validate(response.json())
+            # ngrok's API has no ETag support, so detect unchanged payloads
+            # ourselves: an identical body under the same query means the
+            # previously validated models can be returned as-is. This makes
+            # idle tail polls nearly free.
+            digest = hashlib.blake2b(response.content, digest_size=16).digest()
+            key = (limit, tunnel_name, digest)
+            if key == self._last_list_key:
+                return self._last_list
+            # Validate straight from the response bytes; pydantic-core's JSON
+            # parser skips materializing an intermediate Python dict.
+            data = CapturedRequestList.model_validate_json(response.content)
+            self._last_list_key = key
+            self._last_list = data.requests
             return data.requests
         except httpx.ConnectError as e:
             raise NgrokConnectionError(self.base_url, e) from e
@@ -88,9 +119,9 @@ class NgrokRepository:
             The captured request
         """
         try:
-            response = self._client.get(f"{self.base_url}/api/requests/http/{request_id}")
+            response = self._client.get(f"{self._requests_url}/{request_id}")
             response.raise_for_status()
-            return CapturedRequest.model_validate(response.json())
+            return CapturedRequest.model_validate_json(response.content)
         except httpx.ConnectError as e:
             raise NgrokConnectionError(self.base_url, e) from e
         except httpx.HTTPStatusError as e:
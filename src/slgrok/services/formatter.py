@@ -1,17 +1,112 @@
 """Formatter service for markdown output."""
 
 import base64
+import functools
 import json
-import re
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
 from slgrok.models.output import FormatOptions, debug_log
 from slgrok.models.requests import CapturedRequest, HttpHeaders
 
+# Header names whose values are masked in output
+_SENSITIVE_HEADERS = frozenset(
+    {"authorization", "proxy-authorization", "x-api-key", "cookie", "set-cookie"}
+)
+
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+
+# Characters a JSON document can start with; anything else (e.g. SSE
+# heartbeat text) is rejected without entering the parser
+_JSON_START_CHARS = frozenset('{["tfn-0123456789')
+
+# Shared padding for separators; slicing copies from this instead of
+# allocating fresh '*' * n strings per label.
+_STAR_BAR = "*" * 128
+
+# Code block languages keyed by media subtype (and structured syntax
+# suffix, e.g. application/ld+json)
+_LANG_BY_SUBTYPE = {
+    "json": "json",
+    "xml": "xml",
+    "html": "html",
+    "javascript": "javascript",
+    "css": "css",
+}
+
+
+def _is_hex_line(line: str) -> bool:
+    """True if the line is a bare hex number (a chunk-size line).
+
+    str.rstrip runs in C, which beats regex dispatch on the short lines
+    this sees once per line of a streamed body.
+    """
+    return bool(line) and not line.rstrip(_HEX_DIGITS)
+
+
+@functools.lru_cache(maxsize=256)
+def _pretty_json(text: str) -> str | None:
+    """Parse and pretty-print JSON, memoized by body content.
+
+    Identical bodies recur while tailing (health checks, retries, repeated
+    SSE data lines), so the parse/dump round trip is paid once per distinct
+    payload. Returns None when the text is not valid JSON.
+    """
+    try:
+        if orjson is not None:
+            return orjson.dumps(orjson.loads(text), option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(json.loads(text), indent=2)
+    except ValueError:
+        # Covers both orjson.JSONDecodeError and json.JSONDecodeError
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _code_block_lang(content_type: str) -> str:
+    """Map a lowercased content type to a code block language, memoized.
+
+    A render session sees the same handful of content types over and
+    over (usually application/json), so the parse happens once each.
+    """
+    # One hashed lookup on the media subtype instead of sequential
+    # substring scans; parameters like "; charset=utf-8" are dropped.
+    subtype = content_type.partition(";")[0].strip().rpartition("/")[2]
+    lang = _LANG_BY_SUBTYPE.get(subtype)
+    if lang is not None:
+        return lang
+    # Structured syntax suffixes, e.g. application/ld+json
+    return _LANG_BY_SUBTYPE.get(subtype.rpartition("+")[2], "")
+
+
+@functools.lru_cache(maxsize=128)
+def _build_separator_cached(label: str, width: int) -> str:
+    """Build (and memoize) a separator line for a method/URI label.
+
+    Labels repeat heavily while tailing a busy tunnel, so the rendered
+    separator is cached per (label, width).
+    """
+    # Account for spaces around label
+    label_with_spaces = f" {label} "
+    remaining = width - len(label_with_spaces)
+    if remaining < 2:
+        return f"[bold blue]* {label} *[/bold blue]"
+    left = remaining // 2
+    right = remaining - left
+    bar = _STAR_BAR if remaining <= len(_STAR_BAR) else "*" * remaining
+    return f"[bold blue]{bar[:left]}{label_with_spaces}{bar[:right]}[/bold blue]"
+
 
 class FormatterService:
     """Service for formatting captured requests as markdown."""
 
+    # Stateless; all shared data lives at module level
+    __slots__ = ()
+
     def format_request(self, request: CapturedRequest, options: FormatOptions) -> str:
         """Format a single captured request as markdown.
 
@@ -22,76 +117,84 @@ class FormatterService:
         Returns:
             Markdown formatted string
         """
-        lines: list[str] = []
-
-        # Header with method, path, and status
-        method = request.request.method
-        path = request.request.uri
-        status = request.response.status if request.response else "No Response"
-
-        lines.append(f"[bold cyan]## {method} {path}[/bold cyan]")
-        lines.append(f"[dim]ID:[/dim] {request.id}")
-        lines.append(f"[dim]Status:[/dim] {status}")
-        lines.append(f"[dim]Duration:[/dim] {self._format_duration(request.duration)}")
-        lines.append(f"[dim]Timestamp:[/dim] {self._format_timestamp(request.start)}")
-        lines.append(f"[dim]Tunnel:[/dim] {request.tunnel_name}")
-        lines.append(f"[dim]Remote:[/dim] {request.remote_addr}")
-        lines.append("")
+        # Built as a handful of multi-line section blocks instead of ~20
+        # single-line appends; joined once at the end. Nested model
+        # attributes are bound to locals once rather than re-resolved
+        # through pydantic per section.
+        req = request.request
+        resp = request.response
+        req_headers = req.headers
+        method = req.method
+        path = req.uri
+        status = resp.status if resp else "No Response"
+
+        sections: list[str] = [
+            f"[bold cyan]## {method} {path}[/bold cyan]\n"
+            f"[dim]ID:[/dim] {request.id}\n"
+            f"[dim]Status:[/dim] {status}\n"
+            f"[dim]Duration:[/dim] {self._format_duration(request.duration)}\n"
+            f"[dim]Timestamp:[/dim] {request.start}\n"
+            f"[dim]Tunnel:[/dim] {request.tunnel_name}\n"
+            f"[dim]Remote:[/dim] {request.remote_addr}"
+        ]
 
         # Request headers
         if options.show_headers:
-            lines.append("[bold yellow]### Request Headers[/bold yellow]")
-            lines.extend(self._format_headers(request.request.headers, options.headers_filter))
-            lines.append("")
+            sections.append(
+                "\n".join(
+                    (
+                        "[bold yellow]### Request Headers[/bold yellow]",
+                        *self._format_headers(req_headers, options.headers_filter),
+                    )
+                )
+            )
 
         # Request body (extract just the body from raw HTTP message)
-        request_raw = self._decode_body(request.request.raw, "request", options.debug)
-        request_body = (
-            self._extract_http_body(request_raw, "request", options.debug) if request_raw else ""
-        )
+        request_body = self._decode_and_split(req.raw, "request", options.debug)
         if request_body:
-            lines.append("[bold yellow]### Request Body[/bold yellow]")
-            content_type = self._get_content_type(request.request.headers)
-            body_formatted = self._format_body(request_body, content_type, options)
+            content_type = self._get_content_type(req_headers)
+            body_formatted = self._format_body(
+                request_body, content_type, options, self._get_transfer_encoding(req_headers)
+            )
             lang = self._get_code_block_lang(content_type)
-            lines.append(f"```{lang}")
-            lines.append(body_formatted)
-            lines.append("```")
-            lines.append("")
+            sections.append(
+                f"[bold yellow]### Request Body[/bold yellow]\n```{lang}\n{body_formatted}\n```"
+            )
         elif options.debug:
-            debug_log(f"request body: empty (raw_len={len(request.request.raw or '')})")
+            debug_log(f"request body: empty (raw_len={len(req.raw or '')})")
 
         # Response headers
-        if request.response and options.show_headers:
-            lines.append("[bold green]### Response Headers[/bold green]")
-            lines.extend(self._format_headers(request.response.headers, options.headers_filter))
-            lines.append("")
+        if resp and options.show_headers:
+            sections.append(
+                "\n".join(
+                    (
+                        "[bold green]### Response Headers[/bold green]",
+                        *self._format_headers(resp.headers, options.headers_filter),
+                    )
+                )
+            )
 
         # Response body (extract just the body from raw HTTP message)
-        if request.response:
-            response_raw = self._decode_body(request.response.raw, "response", options.debug)
-            response_body = (
-                self._extract_http_body(response_raw, "response", options.debug)
-                if response_raw
-                else ""
-            )
+        if resp:
+            response_body = self._decode_and_split(resp.raw, "response", options.debug)
             if response_body:
-                lines.append("[bold green]### Response Body[/bold green]")
-                content_type = self._get_content_type(request.response.headers)
-                body_formatted = self._format_body(response_body, content_type, options)
+                content_type = self._get_content_type(resp.headers)
+                body_formatted = self._format_body(
+                    response_body, content_type, options, self._get_transfer_encoding(resp.headers)
+                )
                 lang = self._get_code_block_lang(content_type)
-                lines.append(f"```{lang}")
-                lines.append(body_formatted)
-                lines.append("```")
-                lines.append("")
+                sections.append(
+                    f"[bold green]### Response Body[/bold green]\n```{lang}\n{body_formatted}\n```"
+                )
             elif options.debug:
-                content_type = self._get_content_type(request.response.headers)
+                content_type = self._get_content_type(resp.headers)
                 debug_log(
-                    f"response body: empty (raw_len={len(request.response.raw or '')}, "
+                    f"response body: empty (raw_len={len(resp.raw or '')}, "
                     f"content_type={content_type})"
                 )
 
-        return "\n".join(lines)
+        # Each section was followed by a blank line in the line-based layout
+        return "\n\n".join(sections) + "\n"
 
     def format_requests(
         self,
@@ -123,12 +226,15 @@ class FormatterService:
         lines.append(f"**Retrieved:** {self._format_timestamp(datetime.now(UTC))}")
         lines.append("")
 
-        # Format each request
+        # Format each request; bound methods hoisted out of the loop so
+        # large renders skip the per-iteration attribute lookups
+        build_separator = self._build_separator
+        format_request = self.format_request
+        append = lines.append
         for request in requests:
-            separator = self._build_separator(f"{request.request.method} {request.request.uri}")
-            lines.append(separator)
-            lines.append("")
-            lines.append(self.format_request(request, options))
+            append(build_separator(f"{request.request.method} {request.request.uri}"))
+            append("")
+            append(format_request(request, options))
 
         return "\n".join(lines)
 
@@ -142,14 +248,7 @@ class FormatterService:
         Returns:
             Separator string like "******** POST /api ********"
         """
-        # Account for spaces around label
-        label_with_spaces = f" {label} "
-        remaining = width - len(label_with_spaces)
-        if remaining < 2:
-            return f"[bold blue]* {label} *[/bold blue]"
-        left = remaining // 2
-        right = remaining - left
-        return f"[bold blue]{'*' * left}{label_with_spaces}{'*' * right}[/bold blue]"
+        return _build_separator_cached(label, width)
 
     def _decode_body(self, raw: str | None, label: str = "", debug: bool = False) -> str:
         """Decode a base64-encoded body.
@@ -177,6 +276,55 @@ class FormatterService:
                 debug_log(f"{label} decode: FAILED - {type(e).__name__}: {e}")
             return ""
 
+    def _decode_and_split(self, raw: str | None, label: str = "", debug: bool = False) -> str:
+        """Decode a base64 raw HTTP message and return just its body.
+
+        Fuses _decode_body and _extract_http_body for the formatting hot
+        path: the header/body separator is located on the decoded bytes
+        (C-level find), so only the body slice is UTF-8 decoded and the
+        headers portion is never materialized as a string.
+
+        Args:
+            raw: Base64 encoded HTTP message, can be None
+            label: Label for debug logging (e.g., "request" or "response")
+            debug: Whether to enable debug logging
+
+        Returns:
+            The body portion as a string, or empty string if none
+        """
+        if not raw:
+            if debug:
+                debug_log(f"{label} decode: raw is None/empty")
+            return ""
+        try:
+            decoded = base64.b64decode(raw)
+        except Exception as e:
+            if debug:
+                debug_log(f"{label} decode: FAILED - {type(e).__name__}: {e}")
+            return ""
+
+        # Try \r\n\r\n first (standard HTTP), then \n\n; no separator
+        # means the payload is body-only already.
+        index = decoded.find(b"\r\n\r\n")
+        if index != -1:
+            body_bytes = decoded[index + 4 :]
+        else:
+            index = decoded.find(b"\n\n")
+            body_bytes = decoded[index + 2 :] if index != -1 else decoded
+
+        # Binary payloads (images, archives) would decode to replacement
+        # character soup; show a placeholder instead of paying for the
+        # decode. A NUL in the first KB is a reliable tell.
+        if b"\x00" in body_bytes[:1024]:
+            if debug:
+                debug_log(f"{label} decode: binary body ({len(body_bytes)} bytes), not decoded")
+            return f"(binary, {len(body_bytes)} bytes)"
+
+        body = body_bytes.decode("utf-8", errors="replace")
+        if debug:
+            debug_log(f"{label} decode: b64_len={len(raw)}, body_len={len(body)}")
+        return body
+
     def _extract_http_body(self, raw_message: str, label: str = "", debug: bool = False) -> str:
         """Extract just the body from a raw HTTP message.
 
@@ -191,15 +339,18 @@ class FormatterService:
         Returns:
             Just the body portion, or empty string if not found
         """
-        # Try \r\n\r\n first (standard HTTP)
-        if "\r\n\r\n" in raw_message:
-            body = raw_message.split("\r\n\r\n", 1)[1]
+        # Try \r\n\r\n first (standard HTTP); find + slice scans once
+        # where `in` + split scanned twice and built a throwaway list
+        index = raw_message.find("\r\n\r\n")
+        if index >= 0:
+            body = raw_message[index + 4 :]
             if debug:
                 debug_log(f"{label} extract: found CRLF separator, body_len={len(body)}")
             return body
         # Fall back to \n\n
-        if "\n\n" in raw_message:
-            body = raw_message.split("\n\n", 1)[1]
+        index = raw_message.find("\n\n")
+        if index >= 0:
+            body = raw_message[index + 2 :]
             if debug:
                 debug_log(f"{label} extract: found LF separator, body_len={len(body)}")
             return body
@@ -210,22 +361,37 @@ class FormatterService:
             )
         return raw_message
 
-    def _format_body(self, body: str, content_type: str, options: FormatOptions) -> str:
+    def _format_body(
+        self,
+        body: str,
+        content_type: str,
+        options: FormatOptions,
+        transfer_encoding: str | None = None,
+    ) -> str:
         """Format a body string according to options.
 
         Args:
             body: The body string (already extracted, no HTTP headers)
-            content_type: The content type
+            content_type: The content type (lowercased)
             options: Formatting options
+            transfer_encoding: Lowercased Transfer-Encoding header value,
+                or None when the headers are unavailable
 
         Returns:
             Formatted body string
         """
+        # Nothing to do without pretty-printing or truncation
+        if not options.pretty_print and options.truncate is None:
+            return body
+
         result = body
 
         if options.pretty_print:
-            # Check if this looks like chunked transfer encoding
-            is_chunked = self._is_chunked_body(body)
+            # Only probe for chunked framing when the header says so (or
+            # is unknown); the probe splits the whole body just to find
+            # out most responses are Content-Length framed.
+            may_be_chunked = transfer_encoding is None or "chunked" in transfer_encoding
+            is_chunked = may_be_chunked and self._is_chunked_body(body)
             if options.debug:
                 debug_log(
                     f"format_body: len={len(body)}, content_type={content_type}, is_chunked={is_chunked}"
@@ -234,15 +400,13 @@ class FormatterService:
                 result = self._format_chunked_body(body, content_type)
                 if options.debug:
                     debug_log(f"format_body: chunked formatting applied, result_len={len(result)}")
-            elif "json" in content_type.lower():
-                # Pretty print JSON if requested
-                try:
-                    parsed = json.loads(body)
-                    result = json.dumps(parsed, indent=2)
-                except json.JSONDecodeError as e:
-                    if options.debug:
-                        debug_log(f"format_body: JSON parse failed - {e}")
-                    pass  # Keep original if not valid JSON
+            elif "json" in content_type:
+                # Pretty print JSON if requested; keep original if not valid JSON
+                pretty = _pretty_json(body)
+                if pretty is not None:
+                    result = pretty
+                elif options.debug:
+                    debug_log("format_body: JSON parse failed")
 
         # Truncate if requested
         if options.truncate is not None and len(result) > options.truncate:
@@ -262,18 +426,19 @@ class FormatterService:
         Returns:
             True if body appears to be chunked encoding
         """
-        lines = body.strip().split("\n")
-        if len(lines) < 2:
+        # Only the first and last lines matter, so probe them directly
+        # instead of splitting the whole body into a line list.
+        stripped = body.strip()
+        first_nl = stripped.find("\n")
+        if first_nl == -1:
             return False
 
         # First line should be hex chunk size
-        first_line = lines[0].strip()
-        if not re.match(r"^[0-9a-fA-F]+$", first_line):
+        if not _is_hex_line(stripped[:first_nl].strip()):
             return False
 
         # Last non-empty line should be '0' terminator
-        last_line = lines[-1].strip()
-        return last_line == "0"
+        return stripped[stripped.rfind("\n") + 1 :].strip() == "0"
 
     def _format_chunked_body(self, body: str, _content_type: str) -> str:
         """Format a chunked transfer encoded body.
@@ -288,20 +453,15 @@ class FormatterService:
         Returns:
             Formatted body with JSON pretty-printed in data lines
         """
-        lines = body.split("\n")
+        # Single pass over split lines; str.split is one C-level scan and
+        # the hex check is a C string operation, so no regex per line.
         result_lines: list[str] = []
-        i = 0
-
-        while i < len(lines):
-            line = lines[i].rstrip("\r")
-
-            # Skip hex chunk size lines
-            if re.match(r"^[0-9a-fA-F]+$", line.strip()):
-                # Skip terminating '0' chunk
-                if line.strip() == "0":
-                    i += 1
-                    continue
-                i += 1
+
+        for raw_line in body.split("\n"):
+            line = raw_line.rstrip("\r")
+
+            # Skip hex chunk size lines (including the terminating '0')
+            if _is_hex_line(line.strip()):
                 continue
 
             # Handle SSE data lines
@@ -319,8 +479,6 @@ class FormatterService:
             else:
                 result_lines.append(line)
 
-            i += 1
-
         # Strip trailing empty lines
         while result_lines and not result_lines[-1].strip():
             result_lines.pop()
@@ -336,41 +494,46 @@ class FormatterService:
         Returns:
             Pretty-printed JSON if valid, otherwise original text
         """
-        try:
-            parsed = json.loads(text)
-            return json.dumps(parsed, indent=2)
-        except json.JSONDecodeError:
+        # A cheap first-char screen rejects plain-text SSE lines without
+        # paying for a parse attempt (or a _pretty_json cache slot)
+        if not text or text[0] not in _JSON_START_CHARS:
             return text
+        pretty = _pretty_json(text)
+        return pretty if pretty is not None else text
 
     def _format_headers(
         self,
         headers: HttpHeaders,
         filter_list: list[str] | None,
-    ) -> list[str]:
+    ) -> Iterator[str]:
         """Format headers for display.
 
+        A generator so callers fuse the lines straight into their own
+        output without an intermediate list.
+
         Args:
             headers: The headers to format
             filter_list: Optional list of header names to include
 
-        Returns:
-            List of formatted header lines
+        Yields:
+            Formatted header lines
         """
-        lines: list[str] = []
+        filter_set = frozenset(f.lower() for f in filter_list) if filter_list is not None else None
+
         for name, values in headers.root.items():
+            name_lower = name.lower()
+
             # Apply filter if specified
-            if filter_list is not None and not any(f.lower() == name.lower() for f in filter_list):
+            if filter_set is not None and name_lower not in filter_set:
                 continue
 
             # Mask sensitive headers
-            display_values = values
-            if name.lower() in ("authorization", "x-api-key", "cookie", "set-cookie"):
-                display_values = ["***"]
-
-            for value in display_values:
-                lines.append(f"{name}: {value}")
+            if name_lower in _SENSITIVE_HEADERS:
+                yield f"{name}: ***"
+                continue
 
-        return lines
+            for value in values:
+                yield f"{name}: {value}"
 
     def _format_duration(self, nanoseconds: int) -> str:
         """Format duration in human-readable form.
@@ -381,12 +544,12 @@ class FormatterService:
         Returns:
             Human-readable duration string
         """
-        ms = nanoseconds / 1_000_000
-        if ms < 1:
+        # Integer threshold compares; floats only for the final format
+        if nanoseconds < 1_000_000:
             return f"{nanoseconds / 1_000:.2f}µs"
-        if ms < 1000:
-            return f"{ms:.0f}ms"
-        return f"{ms / 1000:.2f}s"
+        if nanoseconds < 1_000_000_000:
+            return f"{nanoseconds / 1_000_000:.0f}ms"
+        return f"{nanoseconds / 1_000_000_000:.2f}s"
 
     def _format_timestamp(self, dt: datetime) -> str:
         """Format a timestamp for display.
@@ -406,29 +569,31 @@ class FormatterService:
             headers: The headers dict
 
         Returns:
-            Content type string or empty string
+            Lowercased content type string or empty string
+        """
+        # Lowered once here so downstream checks skip their own .lower()
+        content_types = headers.get("content-type")
+        return content_types[0].lower() if content_types else ""
+
+    def _get_transfer_encoding(self, headers: HttpHeaders) -> str:
+        """Extract transfer encoding from headers.
+
+        Args:
+            headers: The headers dict
+
+        Returns:
+            Lowercased transfer encoding string or empty string
         """
-        content_types = headers.root.get("Content-Type", [])
-        return content_types[0] if content_types else ""
+        values = headers.get("transfer-encoding")
+        return values[0].lower() if values else ""
 
     def _get_code_block_lang(self, content_type: str) -> str:
         """Get the appropriate code block language for a content type.
 
         Args:
-            content_type: The content type
+            content_type: The content type (lowercased)
 
         Returns:
             Code block language identifier
         """
-        ct = content_type.lower()
-        if "json" in ct:
-            return "json"
-        if "xml" in ct:
-            return "xml"
-        if "html" in ct:
-            return "html"
-        if "javascript" in ct:
-            return "javascript"
-        if "css" in ct:
-            return "css"
-        return ""
+        return _code_block_lang(content_type)
@@ -1,21 +1,27 @@
 """Inspector service for fetching and filtering requests."""
 
-import fnmatch
-import re
 import time
+from collections import deque
 from collections.abc import Iterator
 from datetime import UTC, datetime
-from urllib.parse import urlparse
+from itertools import islice
 
 from slgrok.models.filters import RequestFilters
 from slgrok.models.output import debug_log
 from slgrok.models.requests import CapturedRequest
 from slgrok.repositories.ngrok import NgrokRepository
 
+# Upper bound on remembered request IDs while tailing. ngrok's inspector
+# buffer is far smaller, so eviction never re-yields in practice, but the
+# set can no longer grow without bound over a long session.
+_TAIL_SEEN_MAX = 10_000
+
 
 class InspectorService:
     """Service for inspecting captured requests."""
 
+    __slots__ = ("repository",)
+
     def __init__(self, repository: NgrokRepository):
         self.repository = repository
 
@@ -34,14 +40,13 @@ class InspectorService:
             tunnel_name=filters.tunnel_name,
         )
 
-        # Apply local filters
-        filtered = self._apply_filters(requests, filters)
-
-        # Apply limit after filtering
+        # Apply local filters lazily; with a limit the iteration stops as
+        # soon as enough matches are found instead of filtering the rest
+        filtered = self._iter_filtered(requests, filters)
         if filters.limit is not None:
-            filtered = filtered[: filters.limit]
+            return list(islice(filtered, filters.limit))
 
-        return filtered
+        return list(filtered)
 
     def tail_requests(
         self,
@@ -59,29 +64,49 @@ class InspectorService:
         Yields:
             New captured requests as they arrive
         """
+        # Exact membership lives in the set; the deque tracks insertion
+        # order so the oldest IDs fall out once the bound is hit.
         seen_ids: set[str] = set()
+        seen_order: deque[str] = deque()
+
+        def remember(request_id: str) -> None:
+            seen_ids.add(request_id)
+            seen_order.append(request_id)
+            if len(seen_order) > _TAIL_SEEN_MAX:
+                seen_ids.discard(seen_order.popleft())
 
         # Get initial requests to populate seen set
         initial = self.repository.get_requests(tunnel_name=filters.tunnel_name)
         for req in initial:
-            seen_ids.add(req.id)
+            remember(req.id)
+        previous = initial
 
         if debug:
             debug_log(f"tail: initialized with {len(seen_ids)} existing requests")
 
+        # Back off while the tunnel is idle; reset as soon as traffic
+        # arrives so bursts are still picked up at the base interval.
+        max_interval = poll_interval * 8
+        interval = poll_interval
+
         while True:
             requests = self.repository.get_requests(tunnel_name=filters.tunnel_name)
 
-            # Find new requests
-            new_requests = [r for r in requests if r.id not in seen_ids]
+            # The repository returns the identical list object when the
+            # poll payload was unchanged; skip the diff entirely then.
+            if requests is previous:
+                new_requests: list[CapturedRequest] = []
+            else:
+                new_requests = [r for r in requests if r.id not in seen_ids]
+                previous = requests
 
             if debug and new_requests:
                 debug_log(f"tail: found {len(new_requests)} new request(s) in poll")
 
-            # Filter and yield new requests
-            filtered = self._apply_filters(new_requests, filters, debug)
+            # Filter and yield new requests (skip the setup on idle polls)
+            filtered = self._apply_filters(new_requests, filters, debug) if new_requests else []
             for req in filtered:
-                seen_ids.add(req.id)
+                remember(req.id)
                 if debug:
                     has_response = req.response is not None
                     has_body = False
@@ -95,7 +120,8 @@ class InspectorService:
                     )
                 yield req
 
-            time.sleep(poll_interval)
+            interval = poll_interval if new_requests else min(interval * 2, max_interval)
+            time.sleep(interval)
 
     def _apply_filters(
         self,
@@ -113,84 +139,66 @@ class InspectorService:
         Returns:
             Filtered list of requests
         """
-        result = requests
-        initial_count = len(result)
-
-        # Filter by status code
-        if filters.status is not None:
-            result = [
-                r
-                for r in result
-                if r.response is not None and filters.status.matches(r.response.status_code)
-            ]
-            if debug and len(result) != initial_count:
-                debug_log(f"filter: status filter reduced {initial_count} -> {len(result)}")
-
-        # Filter by path pattern
-        if filters.path_pattern is not None:
-            before = len(result)
-            result = [r for r in result if self._matches_path(r.request.uri, filters.path_pattern)]
-            if debug and len(result) != before:
-                debug_log(f"filter: path filter reduced {before} -> {len(result)}")
-
-        # Filter by domain
-        if filters.domain is not None:
-            before = len(result)
-            result = [r for r in result if self._matches_domain(r, filters.domain)]
-            if debug and len(result) != before:
-                debug_log(f"filter: domain filter reduced {before} -> {len(result)}")
-
-        # Filter by time window
-        if filters.time_window is not None:
-            before = len(result)
-            cutoff = datetime.now(UTC) - filters.time_window.to_timedelta()
-            result = [r for r in result if r.start >= cutoff]
-            if debug and len(result) != before:
-                debug_log(f"filter: time_window filter reduced {before} -> {len(result)}")
+        if not self._has_local_filters(filters):
+            return requests
 
-        return result
+        result = list(self._iter_filtered(requests, filters))
 
-    def _matches_path(self, uri: str, pattern: str) -> bool:
-        """Check if a URI matches a path pattern.
+        if debug and len(result) != len(requests):
+            debug_log(f"filter: reduced {len(requests)} -> {len(result)}")
 
-        Supports both glob patterns (with *) and regex.
-
-        Args:
-            uri: The request URI
-            pattern: The pattern to match against
-
-        Returns:
-            True if the URI matches the pattern
-        """
-        # Extract path from URI
-        parsed = urlparse(uri)
-        path = parsed.path
+        return result
 
-        # Try glob first if pattern contains glob chars
-        if "*" in pattern or "?" in pattern:
-            return fnmatch.fnmatch(path, pattern)
+    def _has_local_filters(self, filters: RequestFilters) -> bool:
+        """Check whether any locally evaluated filter is active."""
+        return (
+            filters.status is not None
+            or filters.domain is not None
+            or filters.path_pattern is not None
+            or filters.time_window is not None
+        )
 
-        # Otherwise try regex
-        try:
-            return bool(re.search(pattern, path))
-        except re.error:
-            # If invalid regex, do literal match
-            return pattern in path
+    def _iter_filtered(
+        self,
+        requests: list[CapturedRequest],
+        filters: RequestFilters,
+    ) -> Iterator[CapturedRequest]:
+        """Yield requests passing all active filters.
 
-    def _matches_domain(self, request: CapturedRequest, domain: str) -> bool:
-        """Check if a request matches a domain filter.
+        Lazy so callers with a limit can stop as soon as they have
+        enough matches.
 
         Args:
-            request: The captured request
-            domain: The domain to filter by
+            requests: List of requests to filter
+            filters: Filters to apply
 
-        Returns:
-            True if the request is for the specified domain
+        Yields:
+            Requests matching every active filter
         """
-        # Check the Host header
-        host_header = request.request.headers.root.get("Host", [])
-        if host_header:
-            host = host_header[0].lower()
-            return domain.lower() in host
+        if not self._has_local_filters(filters):
+            yield from requests
+            return
+
+        status = filters.status
+        has_domain = filters.domain is not None
+        has_path = filters.path_pattern is not None
+        cutoff = (
+            datetime.now(UTC) - filters.time_window.to_timedelta()
+            if filters.time_window is not None
+            else None
+        )
 
-        return False
+        # One pass over the list instead of a fresh list per filter stage,
+        # with the cheapest predicates evaluated first.
+        for r in requests:
+            if cutoff is not None and r.start_dt < cutoff:
+                continue
+            if status is not None:
+                response = r.response
+                if response is None or not status.matches(response.status_code):
+                    continue
+            if has_domain and not filters.matches_host(r.host):
+                continue
+            if has_path and not filters.matches_path(r.path):
+                continue
+            yield r
@@ -25,7 +25,7 @@ class TestListCommand:
         sample_requests: list[CapturedRequest],
     ) -> None:
         """Test successful list command."""
-        mock_repo = mocker.patch("slgrok.cli.commands.NgrokRepository")
+        mock_repo = mocker.patch("slgrok.repositories.ngrok.NgrokRepository")
         mock_instance = mock_repo.return_value.__enter__.return_value
         mock_instance.get_requests.return_value = sample_requests
 
@@ -41,7 +41,7 @@ class TestListCommand:
         sample_requests: list[CapturedRequest],
     ) -> None:
         """Test list command with limit."""
-        mock_repo = mocker.patch("slgrok.cli.commands.NgrokRepository")
+        mock_repo = mocker.patch("slgrok.repositories.ngrok.NgrokRepository")
         mock_instance = mock_repo.return_value.__enter__.return_value
         mock_instance.get_requests.return_value = sample_requests
 
@@ -57,7 +57,7 @@ class TestListCommand:
         sample_requests: list[CapturedRequest],
     ) -> None:
         """Test list command with errors filter."""
-        mock_repo = mocker.patch("slgrok.cli.commands.NgrokRepository")
+        mock_repo = mocker.patch("slgrok.repositories.ngrok.NgrokRepository")
         mock_instance = mock_repo.return_value.__enter__.return_value
         mock_instance.get_requests.return_value = sample_requests
 
@@ -71,7 +71,7 @@ class TestListCommand:
         """Test list command when ngrok is not running."""
         from slgrok.repositories.ngrok import NgrokConnectionError
 
-        mock_repo = mocker.patch("slgrok.cli.commands.NgrokRepository")
+        mock_repo = mocker.patch("slgrok.repositories.ngrok.NgrokRepository")
         mock_instance = mock_repo.return_value.__enter__.return_value
         mock_instance.get_requests.side_effect = NgrokConnectionError("http://localhost:4040")
 
@@ -85,7 +85,7 @@ class TestListCommand:
         mocker: MockerFixture,
     ) -> None:
         """Test list command with no results."""
-        mock_repo = mocker.patch("slgrok.cli.commands.NgrokRepository")
+        mock_repo = mocker.patch("slgrok.repositories.ngrok.NgrokRepository")
         mock_instance = mock_repo.return_value.__enter__.return_value
         mock_instance.get_requests.return_value = []
 
@@ -104,7 +104,7 @@ class TestGetCommand:
         sample_request: CapturedRequest,
     ) -> None:
         """Test successful get command."""
-        mock_repo = mocker.patch("slgrok.cli.commands.NgrokRepository")
+        mock_repo = mocker.patch("slgrok.repositories.ngrok.NgrokRepository")
         mock_instance = mock_repo.return_value.__enter__.return_value
         mock_instance.get_request.return_value = sample_request
 
@@ -115,7 +115,7 @@ class TestGetCommand:
 
     def test_get_not_found(self, mocker: MockerFixture) -> None:
         """Test get command with nonexistent ID."""
-        mock_repo = mocker.patch("slgrok.cli.commands.NgrokRepository")
+        mock_repo = mocker.patch("slgrok.repositories.ngrok.NgrokRepository")
         mock_instance = mock_repo.return_value.__enter__.return_value
         mock_instance.get_request.side_effect = ValueError("Request not found")
 
@@ -130,7 +130,7 @@ class TestGetCommand:
         sample_request: CapturedRequest,
     ) -> None:
         """Test get command with pretty print."""
-        mock_repo = mocker.patch("slgrok.cli.commands.NgrokRepository")
+        mock_repo = mocker.patch("slgrok.repositories.ngrok.NgrokRepository")
         mock_instance = mock_repo.return_value.__enter__.return_value
         mock_instance.get_request.return_value = sample_request
 
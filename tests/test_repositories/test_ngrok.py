@@ -1,5 +1,7 @@
 """Tests for ngrok repository."""
 
+import json
+
 import httpx
 import pytest
 from pytest_mock import MockerFixture
@@ -36,7 +38,7 @@ class TestNgrokRepository:
         """Test successful request retrieval."""
         mock_response = mocker.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = sample_requests_json
+        mock_response.content = json.dumps(sample_requests_json).encode()
         mock_response.raise_for_status = mocker.Mock()
 
         mock_client = mocker.Mock()
@@ -61,7 +63,7 @@ class TestNgrokRepository:
         """Test request retrieval with limit parameter."""
         mock_response = mocker.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = sample_requests_json
+        mock_response.content = json.dumps(sample_requests_json).encode()
         mock_response.raise_for_status = mocker.Mock()
 
         mock_client = mocker.Mock()
@@ -84,7 +86,7 @@ class TestNgrokRepository:
         """Test request retrieval with tunnel name filter."""
         mock_response = mocker.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = sample_requests_json
+        mock_response.content = json.dumps(sample_requests_json).encode()
         mock_response.raise_for_status = mocker.Mock()
 
         mock_client = mocker.Mock()
@@ -122,7 +124,7 @@ class TestNgrokRepository:
         single_request = sample_requests_json["requests"][0]
         mock_response = mocker.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = single_request
+        mock_response.content = json.dumps(single_request).encode()
         mock_response.raise_for_status = mocker.Mock()
 
         mock_client = mocker.Mock()